@@ -7,7 +7,11 @@ import seaborn as sns
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 import threading
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 import os
+import json
+from collections import Counter
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
@@ -26,11 +30,419 @@ try:
     import sklearn.metrics as metrics
     from sklearn.preprocessing import StandardScaler
     from sklearn.decomposition import PCA
-    from sklearn.cluster import KMeans
+    from sklearn.cluster import KMeans, MiniBatchKMeans
     ADVANCED_STATS = True
 except ImportError:
     ADVANCED_STATS = False
 
+try:
+    from threadpoolctl import threadpool_limits
+    THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    THREADPOOLCTL_AVAILABLE = False
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+try:
+    import pyarrow.dataset as ds
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    # Run the kernels below as plain NumPy code
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+# fastmath without the 'nnan'/'ninf' flags, so the kernels can still skip missing values
+FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Numba's fallback 'workqueue' threading layer aborts the process when two threads launch
+# parallel kernels at once, so every call of a parallel=True kernel holds this lock
+PARALLEL_LOCK = threading.Lock()
+
+
+@njit(cache=True)
+def quartiles(values):
+    """Linearly interpolated Q1 and Q3 of a 1-D array via O(N) selection instead of a sort"""
+    last = values.shape[0] - 1
+    pos1 = 0.25 * last
+    pos3 = 0.75 * last
+    k1 = int(np.floor(pos1))
+    k3 = int(np.floor(pos3))
+    kth = np.array([k1, min(k1 + 1, last), k3, min(k3 + 1, last)])
+    part = np.partition(values, kth)
+    q1 = part[k1] + (part[min(k1 + 1, last)] - part[k1]) * (pos1 - k1)
+    q3 = part[k3] + (part[min(k3 + 1, last)] - part[k3]) * (pos3 - k3)
+    return q1, q3
+
+
+@njit(parallel=True, fastmath=FASTMATH_FLAGS, cache=True)
+def iqr_bounds(X, k):
+    """Per-column Tukey fences (Q1 - k*IQR, Q3 + k*IQR) and outlier counts, ignoring NaNs"""
+    n_cols = X.shape[1]
+    lo = np.full(n_cols, np.nan)
+    hi = np.full(n_cols, np.nan)
+    n_out = np.zeros(n_cols, dtype=np.int64)
+    
+    for j in prange(n_cols):
+        col = X[:, j]
+        values = col[~np.isnan(col)]
+        if values.shape[0] == 0:
+            continue
+        q1, q3 = quartiles(values)
+        lo[j] = q1 - k * (q3 - q1)
+        hi[j] = q3 + k * (q3 - q1)
+        n_out[j] = np.sum((values < lo[j]) | (values > hi[j]))
+    
+    return lo, hi, n_out
+
+
+@njit(parallel=True, fastmath=FASTMATH_FLAGS, cache=True)
+def zscore_flags(X, thresh):
+    """Boolean mask of cells whose |z-score| within their column exceeds thresh"""
+    n_rows, n_cols = X.shape
+    flags = np.zeros((n_rows, n_cols), dtype=np.bool_)
+    
+    for j in prange(n_cols):
+        col = X[:, j]
+        values = col[~np.isnan(col)]
+        if values.shape[0] == 0:
+            continue
+        std = values.std()
+        if std > 0:
+            flags[:, j] = np.abs(col - values.mean()) > thresh * std
+    
+    return flags
+
+
+@njit(cache=True)
+def lttb_indices(x, y, n_out):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets downsampling"""
+    n = x.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    
+    for i in range(n_out - 2):
+        start = int(np.floor(i * every)) + 1
+        end = int(np.floor((i + 1) * every)) + 1
+        next_end = min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + np.argmax(area)
+        indices[i + 1] = a
+    
+    return indices
+
+
+@njit(parallel=True, cache=True)
+def strong_pairs(cm, thresh):
+    """Upper-triangle (row, column, value) entries of a square matrix with |value| > thresh, in row-major order"""
+    n = cm.shape[0]
+    counts = np.zeros(n, dtype=np.int64)
+    
+    # First pass sizes each row's output so the second can fill preallocated arrays in parallel
+    for i in prange(n):
+        c = 0
+        for j in range(i + 1, n):
+            if abs(cm[i, j]) > thresh:
+                c += 1
+        counts[i] = c
+    
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    rows = np.empty(offsets[n], dtype=np.int64)
+    cols = np.empty(offsets[n], dtype=np.int64)
+    values = np.empty(offsets[n], dtype=cm.dtype)
+    
+    for i in prange(n):
+        k = offsets[i]
+        for j in range(i + 1, n):
+            v = cm[i, j]
+            if abs(v) > thresh:
+                rows[k] = i
+                cols[k] = j
+                values[k] = v
+                k += 1
+    
+    return rows, cols, values
+
+
+class DataSnapshot:
+    """One loaded DataFrame with its column lists and the results derived from it"""
+    
+    def __init__(self, df, dataset=None, version=0):
+        # Loading new data builds a new snapshot, so a worker still holding an old one
+        # can't mix it with the new data or write into the new data's cache
+        self.df = df
+        self.dataset = dataset
+        self.version = version
+        self.cache = {}
+        
+        self.column_names = tuple(df.columns)
+        self.numeric_cols = tuple(df.select_dtypes(include=[np.number]).columns)
+        self.categorical_cols = tuple(df.select_dtypes(include=['object', 'string', 'category']).columns)
+    
+    def cached(self, name, compute):
+        """Memoize a result derived from this DataFrame"""
+        if name not in self.cache:
+            self.cache[name] = compute()
+        return self.cache[name]
+    
+    def numeric_data(self):
+        """Return the numeric columns as (DataFrame, centered contiguous float32 matrix, float64 column means)"""
+        def build():
+            numeric_df = self.df[list(self.numeric_cols)]
+            # Center in float64 before narrowing: float32 can't resolve a small spread
+            # around a large offset (epoch timestamps, big IDs)
+            values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+            offsets = np.nan_to_num(np.nanmean(values, axis=0))
+            return numeric_df, np.ascontiguousarray(values - offsets, dtype=np.float32), offsets
+        return self.cached('numeric', build)
+    
+    def count_missing(self):
+        """Missing values per column: one np.isnan pass over the cached numeric matrix, pandas for the rest"""
+        numeric_df, X, _ = self.numeric_data()
+        numeric = set(self.numeric_cols)
+        others = [col for col in self.column_names if col not in numeric]
+        
+        missing = pd.concat([pd.Series(np.isnan(X).sum(axis=0), index=numeric_df.columns),
+                             self.df[others].isna().sum()])
+        return missing.reindex(self.column_names).astype(np.int64)
+    
+    def column(self, column):
+        """Return a full column, read from the lazy dataset (once) when only a preview is loaded"""
+        if self.dataset is not None:
+            return self.cached(('column', column),
+                               lambda: self.dataset.to_table(columns=[column]).column(0).to_pandas())
+        return self.df[column]
+    
+    def preview_note(self):
+        """Report line flagging results computed on the preview rows of a lazily scanned file"""
+        if self.dataset is None:
+            return ""
+        return f"⚠️ Based on the first {len(self.df):,} rows only (preview of a large file)\n"
+    
+    def preview_label(self):
+        """Plot title suffix flagging a plot drawn from the preview rows of a lazily scanned file"""
+        if self.dataset is None:
+            return ""
+        return f" (first {len(self.df):,} rows)"
+    
+    def correlation_matrix(self, dtype):
+        """Pearson correlation matrix of the numeric columns at the given precision, computed once"""
+        return self.cached(('correlation', dtype), lambda: self.compute_correlation(dtype))
+    
+    def compute_correlation(self, dtype):
+        """Pearson correlation matrix of the numeric columns"""
+        numeric_df, X, _ = self.numeric_data()
+        
+        # All-NaN columns carry no correlation information
+        has_values = ~np.isnan(X).all(axis=0)
+        if not has_values.all():
+            numeric_df = numeric_df.loc[:, has_values]
+            X = X[:, has_values]
+        
+        if np.isfinite(X).all():
+            # One BLAS-backed covariance instead of pairwise column loops;
+            # float32 (already centered in float64) halves the bytes moved, 'float64' restores full precision
+            dtype = np.dtype(dtype)
+            if dtype != X.dtype:
+                X = numeric_df.to_numpy(dtype=dtype)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                C = np.atleast_2d(np.corrcoef(X, rowvar=False, dtype=X.dtype))
+        else:
+            # pandas handles missing values pairwise
+            C = numeric_df.corr().to_numpy()
+        
+        return pd.DataFrame(C, index=numeric_df.columns, columns=numeric_df.columns)
+    
+
+
+def build_summary_report(snapshot):
+    """Compute the statistical summary text (runs on a worker thread)"""
+    summary = snapshot.cached('describe', lambda: snapshot.df.describe(
+        include='all', percentiles=[.25, .5, .75]).round(3))
+    
+    parts = [f"""📊 STATISTICAL SUMMARY
+{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+{'='*60}
+{snapshot.preview_note()}
+{summary.to_string()}
+
+📈 Additional Statistics:
+{'='*30}
+"""]
+    
+    # Add more statistics for numeric columns, one vectorized pass per statistic
+    numeric_df, _, _ = snapshot.numeric_data()
+    if not numeric_df.empty:
+        parts.append("\n🔢 NUMERIC COLUMNS ANALYSIS:\n")
+        arr = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        counts = (~np.isnan(arr)).sum(axis=0)
+        if ADVANCED_STATS and len(arr) > 3 and (counts == len(arr)).all():
+            # No missing values: moments and extremes from one scipy call (bias-corrected like pandas)
+            res = stats.describe(arr, axis=0, bias=False)
+            varies = res.variance > 0
+            skews = np.where(varies, res.skewness, 0.0)
+            kurts = np.where(varies, res.kurtosis, 0.0)
+            ranges = res.minmax[1] - res.minmax[0]
+        else:
+            skews = numeric_df.skew().to_numpy()
+            kurts = numeric_df.kurt().to_numpy()
+            ranges = np.nanmax(arr, axis=0) - np.nanmin(arr, axis=0)
+        q25, q75 = np.nanpercentile(arr, [25, 75], axis=0)
+        
+        for col, count, skew, kurt, value_range, iqr in zip(
+                numeric_df.columns, counts, skews, kurts, ranges, q75 - q25):
+            if count > 0:
+                parts.append(f"\n{col}:\n")
+                parts.append(f"  Skewness: {skew:.3f}\n")
+                parts.append(f"  Kurtosis: {kurt:.3f}\n")
+                parts.append(f"  Range: {value_range:.3f}\n")
+                parts.append(f"  IQR: {iqr:.3f}\n")
+    
+    # Add categorical analysis
+    cat_cols = snapshot.categorical_cols
+    if len(cat_cols) > 0:
+        parts.append("\n\n📝 CATEGORICAL COLUMNS ANALYSIS:\n")
+        for col in cat_cols:
+            unique_count = snapshot.df[col].nunique()
+            most_common = snapshot.df[col].mode().iloc[0] if len(snapshot.df[col].mode()) > 0 else "N/A"
+            parts.append(f"\n{col}:\n")
+            parts.append(f"  Unique values: {unique_count}\n")
+            parts.append(f"  Most common: {most_common}\n")
+    
+    return "".join(parts)
+
+
+def build_correlation_report(snapshot, dtype):
+    """Compute the correlation analysis text (runs on a worker thread)"""
+    corr_matrix = snapshot.correlation_matrix(dtype)
+    
+    # Wide matrices are unreadable as text: show a corner and leave the rest to the export
+    n_cols = corr_matrix.shape[1]
+    preview = corr_matrix.iloc[:20, :20].round(3).to_string()
+    if n_cols > 20:
+        preview += f"\n… first 20 of {n_cols} columns shown, use Export Matrix for the full table"
+    
+    parts = [f"""🔗 CORRELATION ANALYSIS
+{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+{'='*50}
+{snapshot.preview_note()}
+Correlation Matrix:
+{preview}
+
+🔥 Strong Correlations (|r| > 0.7):
+{'='*40}
+"""]
+    
+    # Find strong correlations (upper triangle only, the matrix is symmetric)
+    cm = corr_matrix.to_numpy()
+    if NUMBA_AVAILABLE and cm.shape[0] > 500:
+        # Stream the triangle instead of materializing an N x N mask
+        with PARALLEL_LOCK:
+            i_idx, j_idx, values = strong_pairs(np.ascontiguousarray(cm), 0.7)
+    else:
+        i_idx, j_idx = np.where(np.triu(np.abs(cm) > 0.7, k=1))
+        values = cm[i_idx, j_idx]
+    cols = corr_matrix.columns.to_numpy()
+    strong_corr = list(zip(cols[i_idx], cols[j_idx], values))
+    
+    if strong_corr:
+        for col1, col2, corr_val in strong_corr:
+            parts.append(f"{col1} ↔ {col2}: {corr_val:.3f}\n")
+    else:
+        parts.append("No strong correlations found (|r| > 0.7)\n")
+    
+    return "".join(parts)
+
+
+def build_column_report(snapshot, column):
+    """Compute the single-column analysis text (runs on a worker thread)"""
+    data = snapshot.column(column)
+    
+    parts = [f"""🔍 COLUMN ANALYSIS: {column}
+{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+{'='*50}
+
+Data Type: {data.dtype}
+Non-null Count: {data.count():,} / {len(data):,}
+Missing Values: {data.isnull().sum():,} ({data.isnull().sum()/len(data)*100:.1f}%)
+
+"""]
+    
+    if data.dtype in ['int64', 'float64']:
+        values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+        q1, q2, q3 = np.nanpercentile(values, [25, 50, 75])
+        values = values[~np.isnan(values)]
+        
+        if ADVANCED_STATS and len(values) > 3:
+            # Moments and extremes from one scipy call (bias-corrected like pandas)
+            res = stats.describe(values, bias=False)
+            varies = res.variance > 0
+            col_stats = {
+                'mean': res.mean, 'median': q2, 'std': np.sqrt(res.variance),
+                'min': res.minmax[0], 'max': res.minmax[1],
+                'skew': res.skewness if varies else 0.0,
+                'kurt': res.kurtosis if varies else 0.0
+            }
+        else:
+            # One fused aggregation instead of a scan per statistic
+            col_stats = data.agg(['mean', 'median', 'std', 'min', 'max', 'skew', 'kurt'])
+        mode = data.mode()
+        parts.append(f"""📊 NUMERIC ANALYSIS:
+Mean: {col_stats['mean']:.3f}
+Median: {col_stats['median']:.3f}
+Mode: {mode.iloc[0] if len(mode) > 0 else 'N/A'}
+Standard Deviation: {col_stats['std']:.3f}
+Min: {col_stats['min']:.3f}
+Max: {col_stats['max']:.3f}
+Range: {col_stats['max'] - col_stats['min']:.3f}
+Skewness: {col_stats['skew']:.3f}
+Kurtosis: {col_stats['kurt']:.3f}
+
+Quartiles:
+Q1 (25%): {q1:.3f}
+Q2 (50%): {q2:.3f}
+Q3 (75%): {q3:.3f}
+IQR: {q3 - q1:.3f}
+""")
+    else:
+        value_counts = data.value_counts().head(10)
+        parts.append(f"""📝 CATEGORICAL ANALYSIS:
+Unique Values: {data.nunique():,}
+Most Common: {data.mode().iloc[0] if len(data.mode()) > 0 else 'N/A'}
+
+Top 10 Values:
+{value_counts.to_string()}
+""")
+    
+    return "".join(parts)
+
+
 class DataAnalysisStudio:
     def __init__(self, root):
         self.root = root
@@ -41,8 +453,18 @@ class DataAnalysisStudio:
         # Data storage
         self.df = None
         self.current_file = None
+        self.dataset = None
         self.analysis_history = []
         self.current_plot = None
+        self.loading = False
+        self.snapshot = None
+        self.data_version = 0
+        self.column_names = ()
+        self.numeric_cols = ()
+        self.categorical_cols = ()
+        
+        # Long-running analyses run here so the Tk event loop never blocks
+        self.executor = ThreadPoolExecutor(max_workers=2)
         
         # Colors theme
         self.colors = {
@@ -65,14 +487,40 @@ class DataAnalysisStudio:
             'color_palette': 'husl',
             'figure_size': (10, 6),
             'dpi': 100,
+            'save_dpi': 150,
             'auto_save_plots': False,
-            'statistical_significance': 0.05
+            'statistical_significance': 0.05,
+            'max_plot_points': 50000,
+            'line_plot_points': 4000,
+            'large_file_mb': 500,
+            'preview_rows': 100000,
+            'category_threshold': 0.5,
+            'n_clusters': 3,
+            'minibatch_threshold': 20000,
+            'corr_dtype': 'float32'
         }
         
+        self.setup_runtime()
         self.setup_styles()
         self.create_gui()
         self.setup_matplotlib_style()
         
+        # Pay import/JIT costs while the welcome screen is showing
+        threading.Thread(target=self.warm_up, daemon=True).start()
+        
+    def setup_runtime(self):
+        """Configure NumPy/pandas runtime behaviour for an interactive app"""
+        # Leave cores for the Tk thread instead of letting BLAS grab all of them
+        if THREADPOOLCTL_AVAILABLE:
+            threadpool_limits(limits=min(8, os.cpu_count() or 1), user_api='blas')
+        
+        # Copy-on-Write avoids defensive copies; it is always on from pandas 3.0
+        if int(pd.__version__.split('.')[0]) < 3:
+            try:
+                pd.set_option('mode.copy_on_write', True)
+            except KeyError:
+                pass
+    
     def setup_styles(self):
         """Configure ttk styles"""
         style = ttk.Style()
@@ -104,6 +552,26 @@ class DataAnalysisStudio:
         style.map('Custom.TNotebook.Tab',
                  background=[('selected', self.colors['accent'])])
     
+    def warm_up(self):
+        """Import and compile the heavy numeric paths ahead of the first user action"""
+        try:
+            if PYARROW_AVAILABLE:
+                # Imported for its side effect: loading the CSV reader module ahead of time
+                importlib.import_module('pyarrow.csv')
+            
+            sample = np.arange(32, dtype=np.float32).reshape(8, 4)
+            with PARALLEL_LOCK:
+                iqr_bounds(sample, 1.5)
+                zscore_flags(sample, 3.0)
+                strong_pairs(np.eye(4, dtype=np.float32), 0.7)
+            lttb_indices(np.arange(8, dtype=np.float64), np.arange(8, dtype=np.float64), 4)
+            
+            if ADVANCED_STATS:
+                PCA(n_components=2).fit(sample)
+        except Exception:
+            # Warm-up is best effort; the real call will surface any error
+            pass
+    
     def setup_matplotlib_style(self):
         """Setup matplotlib and seaborn styling"""
         # Set style
@@ -223,8 +691,9 @@ class DataAnalysisStudio:
         btn_frame = tk.Frame(data_frame, bg=self.colors['bg_medium'])
         btn_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        ttk.Button(btn_frame, text="📂 Load Data", command=self.load_data,
-                  style='Custom.TButton', width=12).pack(side=tk.LEFT, padx=2)
+        self.load_button = ttk.Button(btn_frame, text="📂 Load Data", command=self.load_data,
+                                      style='Custom.TButton', width=12)
+        self.load_button.pack(side=tk.LEFT, padx=2)
         ttk.Button(btn_frame, text="🎲 Sample", command=self.load_sample_data,
                   style='Custom.TButton', width=12).pack(side=tk.LEFT, padx=2)
         ttk.Button(btn_frame, text="🧹 Clean", command=self.data_cleaner,
@@ -316,6 +785,7 @@ class DataAnalysisStudio:
         corr_buttons = [
             ("🔥 Correlation Matrix", self.correlation_analysis),
             ("📊 Heatmap", self.plot_correlation_heatmap),
+            ("💾 Export Matrix", self.export_correlation_matrix),
             ("🎯 Feature Importance", self.feature_importance)
         ]
         
@@ -445,6 +915,15 @@ class DataAnalysisStudio:
         self.canvas = FigureCanvasTkAgg(self.fig, self.plot_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # Persistent plot state, reused between plots of the same kind
+        self.plot_axes = None
+        self.plot_kind = None
+        self.scatter_artist = None
+        self.scatter_source = None
+        self.draw_pending = False
+        self.welcome_background = None
+        self.welcome_size = None
+        
         # Add navigation toolbar
         toolbar_frame = tk.Frame(self.plot_frame, bg=self.colors['bg_medium'])
         toolbar_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
@@ -456,6 +935,18 @@ class DataAnalysisStudio:
         # Initial welcome plot
         self.create_welcome_plot()
     
+    def schedule_draw(self):
+        """Lay out and redraw the figure once the event loop is idle, coalescing rapid requests"""
+        if not self.draw_pending:
+            self.draw_pending = True
+            self.root.after_idle(self.do_draw)
+    
+    def do_draw(self):
+        """Run the deferred layout and redraw"""
+        self.draw_pending = False
+        self.fig.tight_layout()
+        self.canvas.draw_idle()
+    
     def setup_data_view(self):
         """Setup data viewing area"""
         # Data preview
@@ -467,17 +958,26 @@ class DataAnalysisStudio:
         # Create treeview for data display
         self.data_tree = ttk.Treeview(preview_frame)
         
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=self.data_tree.yview)
+        # Scrollbars (vertical scrolling is virtual: it moves a window over the DataFrame)
+        self.data_scrollbar = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=self.on_data_scroll)
         h_scrollbar = ttk.Scrollbar(preview_frame, orient=tk.HORIZONTAL, command=self.data_tree.xview)
         
-        self.data_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.data_tree.configure(xscrollcommand=h_scrollbar.set)
         
         # Pack scrollbars and treeview
-        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.data_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         self.data_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Only the visible rows live in the treeview
+        self.view_start = 0
+        self.view_rows = 30
+        self.rendered_window = None
+        self.data_tree.bind('<Configure>', self.on_data_view_resize)
+        self.data_tree.bind('<MouseWheel>', self.on_data_wheel)
+        self.data_tree.bind('<Button-4>', self.on_data_wheel)
+        self.data_tree.bind('<Button-5>', self.on_data_wheel)
+        
         # Add sample data message
         self.data_tree.heading('#0', text='📊 Load data to view here', anchor=tk.W)
     
@@ -534,6 +1034,21 @@ Ready to analyze some data? 📈
                                         font=('Segoe UI', 10))
         self.data_status_label.pack(side=tk.RIGHT, padx=10, pady=5)
     
+    def prepare_axes(self, kind, reuse=False):
+        """Return (axes, reused): the persistent plot Axes, cleared unless reuse is asked for the same kind"""
+        intact = self.plot_axes is not None and self.fig.axes == [self.plot_axes]
+        reused = intact and reuse and kind == self.plot_kind
+        
+        if not intact:
+            # Welcome screen or extra axes (colorbars) present: start from a fresh figure
+            self.fig.clear()
+            self.plot_axes = self.fig.add_subplot(111)
+        elif not reused:
+            self.plot_axes.cla()
+        
+        self.plot_kind = kind
+        return self.plot_axes, reused
+    
     def create_welcome_plot(self):
         """Create welcome plot"""
         ax = self.fig.add_subplot(111)
@@ -544,7 +1059,16 @@ Ready to analyze some data? 📈
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 1)
         ax.axis('off')
-        self.canvas.draw()
+        
+        # The welcome screen never changes, so reuse its pixels while the canvas size is unchanged
+        size = self.canvas.get_width_height()
+        if self.welcome_background is not None and self.welcome_size == size:
+            self.canvas.restore_region(self.welcome_background)
+            self.canvas.blit(self.fig.bbox)
+        else:
+            self.canvas.draw()
+            self.welcome_background = self.canvas.copy_from_bbox(self.fig.bbox)
+            self.welcome_size = size
     
     def update_status(self, message, status_type="info"):
         """Update status bar"""
@@ -561,14 +1085,18 @@ Ready to analyze some data? 📈
         """Update data status in status bar"""
         if self.df is not None:
             rows, cols = self.df.shape
+            preview = " (preview)" if self.dataset is not None else ""
             self.data_status_label.config(
-                text=f"📊 {rows:,} rows × {cols} columns | File: {os.path.basename(self.current_file) if self.current_file else 'Sample Data'}"
+                text=f"📊 {rows:,} rows{preview} × {cols} columns | File: {os.path.basename(self.current_file) if self.current_file else 'Sample Data'}"
             )
         else:
             self.data_status_label.config(text="No data loaded")
     
     def load_data(self):
         """Load data from file"""
+        if self.loading:
+            return
+        
         file_path = filedialog.askopenfilename(
             title="Select dataset file",
             filetypes=[
@@ -580,57 +1108,156 @@ Ready to analyze some data? 📈
         )
         
         if file_path:
+            self.loading = True
+            self.load_button.state(['disabled'])
+            self.update_status("📂 Loading data...", "info")
+            
+            # Parse off the Tk thread so the UI stays responsive
+            threading.Thread(target=self.load_data_worker, args=(file_path,), daemon=True).start()
+    
+    def load_data_worker(self, file_path):
+        """Read the dataset in a background thread and hand it back to the Tk thread"""
+        try:
+            dataset = None
+            if self.is_large_csv(file_path):
+                # Keep a lazy scanner and only materialize a preview sample
+                dataset = ds.dataset(file_path, format='csv')
+                df = dataset.head(self.settings['preview_rows']).to_pandas()
+            else:
+                df = self.read_dataset(file_path)
+            self.convert_categories(df)
+        except Exception as e:
+            self.root.after(0, self.load_data_failed, e)
+        else:
+            self.root.after(0, self.finish_load, df, file_path, dataset)
+    
+    def convert_categories(self, df):
+        """Store low-cardinality text columns as pandas categoricals (in place)"""
+        if len(df) == 0:
+            return
+        # 'string' catches pandas' dedicated text dtype, the default for text from pandas 3.0
+        for col in df.select_dtypes(include=['object', 'string']).columns:
             try:
-                self.update_status("📂 Loading data...", "info")
-                
-                # Load based on file extension
-                if file_path.endswith('.csv'):
-                    self.df = pd.read_csv(file_path)
-                elif file_path.endswith(('.xlsx', '.xls')):
-                    self.df = pd.read_excel(file_path)
-                elif file_path.endswith('.json'):
-                    self.df = pd.read_json(file_path)
-                else:
-                    # Try CSV as default
-                    self.df = pd.read_csv(file_path)
-                
-                self.current_file = file_path
-                self.update_data_display()
-                self.update_column_list()
-                self.show_data_info()
-                self.update_status("✅ Data loaded successfully!", "success")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load data:\n{str(e)}")
-                self.update_status("❌ Failed to load data", "error")
+                n_unique = df[col].nunique()
+            except TypeError:
+                # Nested JSON values (dicts, lists) can't be hashed; keep them as objects
+                continue
+            if n_unique / len(df) < self.settings['category_threshold']:
+                df[col] = df[col].astype('category')
+    
+    def is_large_csv(self, file_path):
+        """Check whether a CSV file is big enough to be scanned lazily"""
+        if not PYARROW_AVAILABLE or file_path.endswith(('.xlsx', '.xls', '.json')):
+            return False
+        return os.path.getsize(file_path) > self.settings['large_file_mb'] * 1024**2
+    
+    def finish_load(self, df, file_path, dataset=None):
+        """Install a freshly loaded dataset (runs on the Tk thread)"""
+        self.loading = False
+        self.load_button.state(['!disabled'])
+        
+        try:
+            self.df = df
+            self.current_file = file_path
+            self.dataset = dataset
+            self.invalidate_caches()
+            self.update_data_display()
+            self.update_column_list()
+            self.show_data_info()
+            self.update_status("✅ Data loaded successfully!", "success")
+            
+        except Exception as e:
+            self.load_data_failed(e)
     
+    def load_data_failed(self, error):
+        """Report a failed load (runs on the Tk thread)"""
+        self.loading = False
+        self.load_button.state(['!disabled'])
+        messagebox.showerror("Error", f"Failed to load data:\n{str(error)}")
+        self.update_status("❌ Failed to load data", "error")
+
+    def read_dataset(self, file_path):
+        """Read a dataset file into a DataFrame, preferring the fastest available parser"""
+        # Load based on file extension
+        if file_path.endswith(('.xlsx', '.xls')):
+            try:
+                return pd.read_excel(file_path, engine='calamine')
+            except (ImportError, ValueError):
+                return pd.read_excel(file_path)
+
+        if file_path.endswith('.json'):
+            if self.is_json_lines(file_path):
+                try:
+                    return pd.read_json(file_path, lines=True, engine='pyarrow')
+                except (ImportError, ValueError, TypeError):
+                    return pd.read_json(file_path, lines=True)
+            return pd.read_json(file_path)
+
+        # CSV, and CSV as default for anything else
+        try:
+            return pd.read_csv(file_path, engine='pyarrow')
+        except (ImportError, ValueError):
+            return pd.read_csv(file_path)
+
+    def is_json_lines(self, file_path):
+        """Check whether a JSON file holds one record per line"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            lines = []
+            for line in f:
+                line = line.strip()
+                if line:
+                    lines.append(line)
+                if len(lines) == 2:
+                    break
+
+        if len(lines) < 2 or not all(line.startswith('{') for line in lines):
+            return False
+        try:
+            json.loads(lines[0])
+        except ValueError:
+            return False
+        return True
+
     def load_sample_data(self):
         """Load sample dataset for demonstration"""
         try:
             # Create sample data
-            np.random.seed(42)
+            rng = np.random.default_rng(42)
             n_samples = 1000
             
-            sample_data = {
-                'Age': np.random.normal(35, 12, n_samples).astype(int),
-                'Income': np.random.normal(50000, 20000, n_samples),
-                'Education_Years': np.random.normal(14, 3, n_samples),
-                'Experience': np.random.normal(10, 8, n_samples),
-                'Satisfaction': np.random.uniform(1, 10, n_samples),
-                'Department': np.random.choice(['IT', 'Sales', 'Marketing', 'HR', 'Finance'], n_samples),
-                'Performance_Score': np.random.normal(75, 15, n_samples),
-                'City': np.random.choice(['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix'], n_samples)
-            }
+            # Age, Income, Education_Years, Experience, Performance_Score drawn in one batch
+            means = np.array([35, 50000, 14, 10, 75], dtype=np.float64)
+            scales = np.array([12, 20000, 3, 8, 15], dtype=np.float64)
+            lower = np.array([18, 25000, 8, 0, 0], dtype=np.float64)
+            upper = np.array([65, 150000, 20, 40, 100], dtype=np.float64)
             
+            X = np.empty((n_samples, 5), dtype=np.float64)
+            rng.standard_normal(out=X)
+            np.multiply(X, scales, out=X)
+            np.add(X, means, out=X)
             # Ensure realistic constraints
-            sample_data['Age'] = np.clip(sample_data['Age'], 18, 65)
-            sample_data['Income'] = np.clip(sample_data['Income'], 25000, 150000)
-            sample_data['Education_Years'] = np.clip(sample_data['Education_Years'], 8, 20).astype(int)
-            sample_data['Experience'] = np.clip(sample_data['Experience'], 0, 40).astype(int)
-            sample_data['Performance_Score'] = np.clip(sample_data['Performance_Score'], 0, 100)
+            np.clip(X, lower, upper, out=X)
+            
+            departments = ['IT', 'Sales', 'Marketing', 'HR', 'Finance']
+            cities = ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix']
+            
+            sample_data = {
+                'Age': X[:, 0].astype(int),
+                'Income': X[:, 1],
+                'Education_Years': X[:, 2].astype(int),
+                'Experience': X[:, 3].astype(int),
+                'Satisfaction': rng.uniform(1, 10, n_samples),
+                'Department': pd.Categorical.from_codes(
+                    rng.integers(0, len(departments), n_samples).astype(np.int8), categories=departments),
+                'Performance_Score': X[:, 4],
+                'City': pd.Categorical.from_codes(
+                    rng.integers(0, len(cities), n_samples).astype(np.int8), categories=cities)
+            }
             
             self.df = pd.DataFrame(sample_data)
             self.current_file = None
+            self.dataset = None
+            self.invalidate_caches()
             
             self.update_data_display()
             self.update_column_list()
@@ -640,14 +1267,30 @@ Ready to analyze some data? 📈
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create sample data:\n{str(e)}")
     
+    def invalidate_caches(self):
+        """Drop everything derived from the current DataFrame and re-read its column lists"""
+        self.data_version += 1
+        self.snapshot = DataSnapshot(self.df, self.dataset, self.data_version)
+        
+        self.column_names = self.snapshot.column_names
+        self.numeric_cols = self.snapshot.numeric_cols
+        self.categorical_cols = self.snapshot.categorical_cols
+    
+    def cached(self, name, compute):
+        """Memoize a result derived from the current DataFrame"""
+        return self.snapshot.cached(name, compute)
+    
+    def get_numeric_data(self):
+        """Return the numeric columns as (DataFrame, centered contiguous float32 matrix, float64 column means)"""
+        return self.snapshot.numeric_data()
+    
     def update_data_display(self):
         """Update data display in treeview"""
         if self.df is None:
             return
         
         # Clear existing data
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
+        self.data_tree.delete(*self.data_tree.get_children())
         
         # Configure columns
         columns = list(self.df.columns)
@@ -659,36 +1302,97 @@ Ready to analyze some data? 📈
             self.data_tree.heading(col, text=col)
             self.data_tree.column(col, width=100, anchor='center')
         
-        # Insert data (first 100 rows for performance)
-        display_rows = min(100, len(self.df))
-        for i in range(display_rows):
-            values = []
-            for col in columns:
-                val = self.df.iloc[i][col]
-                if pd.isna(val):
-                    values.append("NaN")
-                elif isinstance(val, float):
-                    values.append(f"{val:.3f}")
-                else:
-                    values.append(str(val))
-            self.data_tree.insert('', 'end', values=values)
+        # Show the rows in the current viewport
+        self.view_start = 0
+        self.rendered_window = None
+        self.render_data_view()
         
         # Update status
         self.update_data_status()
+    
+    def render_data_view(self):
+        """Fill the treeview with the rows of the DataFrame inside the viewport"""
+        if self.df is None:
+            return
+        
+        total = len(self.df)
+        self.view_start = max(0, min(self.view_start, total - self.view_rows))
+        stop = min(self.view_start + self.view_rows, total)
+        
+        # Scrolling past either end (or a repeated moveto) leaves nothing to redo
+        if self.rendered_window == (self.view_start, stop):
+            return
+        self.rendered_window = (self.view_start, stop)
+        
+        formatted = self.format_rows(self.df.iloc[self.view_start:stop])
+        
+        # Reuse the existing items and only add/remove the difference
+        items = list(self.data_tree.get_children())
+        if len(items) > len(formatted):
+            self.data_tree.delete(*items[len(formatted):])
+            items = items[:len(formatted)]
+        for item, row in zip(items, formatted):
+            self.data_tree.item(item, values=tuple(row))
+        for row in formatted[len(items):]:
+            self.data_tree.insert('', 'end', values=tuple(row))
+        
+        if total:
+            self.data_scrollbar.set(self.view_start / total, stop / total)
+        else:
+            self.data_scrollbar.set(0, 1)
+    
+    def on_data_scroll(self, action, amount, unit=None):
+        """Move the data viewport in response to the vertical scrollbar"""
+        if self.df is None:
+            return
         
-        # Add note if data was truncated
-        if len(self.df) > 100:
-            self.data_tree.insert('', 'end', values=['...' for _ in columns])
-            note_values = [f'Showing first 100 of {len(self.df)} rows' if i == 0 else '' for i in range(len(columns))]
-            self.data_tree.insert('', 'end', values=note_values)
+        if action == 'moveto':
+            self.view_start = int(float(amount) * len(self.df))
+        elif action == 'scroll':
+            step = int(amount)
+            if unit == 'pages':
+                step *= self.view_rows
+            self.view_start += step
+        self.render_data_view()
+    
+    def on_data_wheel(self, event):
+        """Scroll the data viewport with the mouse wheel"""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self.on_data_scroll('scroll', direction * 3, 'units')
+        return 'break'
+    
+    def on_data_view_resize(self, event):
+        """Resize the viewport to the number of rows that fit in the treeview"""
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        # Leave room for the heading row
+        rows = max(1, (event.height - 25) // row_height)
+        if rows != self.view_rows:
+            self.view_rows = rows
+            self.render_data_view()
+    
+    def format_rows(self, sub):
+        """Format a DataFrame slice into rows of display strings"""
+        formatted = []
+        for col in sub.columns:
+            series = sub[col]
+            # One dtype branch per column, none per cell
+            if pd.api.types.is_float_dtype(series.dtype):
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan).tolist()
+                formatted.append(['NaN' if v != v else f'{v:.3f}' for v in values])
+            else:
+                missing = series.isna().to_numpy().tolist()
+                formatted.append(['NaN' if m else str(v) for v, m in zip(series.tolist(), missing)])
+        
+        if not formatted:
+            return [() for _ in range(len(sub))]
+        return list(zip(*formatted))
     
     def update_column_list(self):
         """Update column selection combo box"""
         if self.df is not None:
-            columns = list(self.df.columns)
-            self.column_combo['values'] = columns
-            if columns:
-                self.column_combo.set(columns[0])
+            self.column_combo['values'] = self.column_names
+            if self.column_names:
+                self.column_combo.set(self.column_names[0])
     
     def show_data_info(self):
         """Show basic data information"""
@@ -698,40 +1402,41 @@ Ready to analyze some data? 📈
             return
         
         try:
-            info_text = f"""📊 DATASET OVERVIEW
+            parts = [f"""📊 DATASET OVERVIEW
 {'='*40}
-📏 Shape: {self.df.shape[0]:,} rows × {self.df.shape[1]} columns
+📏 Shape: {self.df.shape[0]:,} rows{" (preview)" if self.dataset is not None else ""} × {self.df.shape[1]} columns
 💾 Memory: {self.df.memory_usage(deep=True).sum() / 1024**2:.2f} MB
 
 📋 COLUMN TYPES
 {'='*40}
-"""
-            for dtype in self.df.dtypes.value_counts().index:
-                count = self.df.dtypes.value_counts()[dtype]
-                info_text += f"{str(dtype):15} : {count:2d} columns\n"
+"""]
+            # Group by name so categoricals with different categories count together
+            for dtype, count in self.df.dtypes.astype(str).value_counts().items():
+                parts.append(f"{dtype:15} : {count:2d} columns\n")
             
-            info_text += f"\n🔍 MISSING VALUES\n{'='*40}\n"
-            missing = self.df.isnull().sum()
-            missing_percent = (missing / len(self.df)) * 100
+            parts.append(f"\n🔍 MISSING VALUES\n{'='*40}\n")
+            n_rows = len(self.df)
+            missing = self.cached('missing', self.snapshot.count_missing)
+            missing_percent = (missing / n_rows) * 100
             
             if missing.sum() == 0:
-                info_text += "✅ No missing values found!\n"
+                parts.append("✅ No missing values found!\n")
             else:
                 for col in missing[missing > 0].index:
-                    info_text += f"{col:20} : {missing[col]:4d} ({missing_percent[col]:.1f}%)\n"
+                    parts.append(f"{col:20} : {missing[col]:4d} ({missing_percent[col]:.1f}%)\n")
             
-            info_text += f"\n📊 QUICK STATS\n{'='*40}\n"
-            numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-            info_text += f"🔢 Numeric columns: {len(numeric_cols)}\n"
+            parts.append(f"\n📊 QUICK STATS\n{'='*40}\n")
+            numeric_cols = list(self.numeric_cols)
+            parts.append(f"🔢 Numeric columns: {len(numeric_cols)}\n")
             
-            categorical_cols = self.df.select_dtypes(include=['object']).columns
-            info_text += f"📝 Categorical columns: {len(categorical_cols)}\n"
+            categorical_cols = self.categorical_cols
+            parts.append(f"📝 Categorical columns: {len(categorical_cols)}\n")
             
             if len(numeric_cols) > 0:
-                info_text += f"📈 Numeric range: {self.df[numeric_cols].min().min():.2f} to {self.df[numeric_cols].max().max():.2f}\n"
+                parts.append(f"📈 Numeric range: {self.df[numeric_cols].min().min():.2f} to {self.df[numeric_cols].max().max():.2f}\n")
             
             self.data_info_text.delete(1.0, tk.END)
-            self.data_info_text.insert(tk.END, info_text)
+            self.data_info_text.insert(tk.END, "".join(parts))
             
         except Exception as e:
             self.update_status(f"❌ Error showing data info: {str(e)}", "error")
@@ -742,57 +1447,9 @@ Ready to analyze some data? 📈
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
-        try:
-            summary = self.df.describe(include='all').round(3)
-            
-            # Display in results tab
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.delete(1.0, tk.END)
-            
-            result_text = f"""📊 STATISTICAL SUMMARY
-{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-{'='*60}
-
-{summary.to_string()}
-
-📈 Additional Statistics:
-{'='*30}
-"""
-            
-            # Add more statistics for numeric columns
-            numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-            if len(numeric_cols) > 0:
-                result_text += "\n🔢 NUMERIC COLUMNS ANALYSIS:\n"
-                for col in numeric_cols:
-                    data = self.df[col].dropna()
-                    if len(data) > 0:
-                        result_text += f"\n{col}:\n"
-                        result_text += f"  Skewness: {data.skew():.3f}\n"
-                        result_text += f"  Kurtosis: {data.kurtosis():.3f}\n"
-                        result_text += f"  Range: {data.max() - data.min():.3f}\n"
-                        result_text += f"  IQR: {data.quantile(0.75) - data.quantile(0.25):.3f}\n"
-            
-            # Add categorical analysis
-            cat_cols = self.df.select_dtypes(include=['object']).columns
-            if len(cat_cols) > 0:
-                result_text += "\n\n📝 CATEGORICAL COLUMNS ANALYSIS:\n"
-                for col in cat_cols:
-                    unique_count = self.df[col].nunique()
-                    most_common = self.df[col].mode().iloc[0] if len(self.df[col].mode()) > 0 else "N/A"
-                    result_text += f"\n{col}:\n"
-                    result_text += f"  Unique values: {unique_count}\n"
-                    result_text += f"  Most common: {most_common}\n"
-            
-            self.results_text.insert(tk.END, result_text)
-            self.results_text.config(state=tk.DISABLED)
-            
-            # Switch to results tab
-            self.right_notebook.select(self.results_frame)
-            
-            self.update_status("✅ Statistical summary generated", "success")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate summary:\n{str(e)}")
+        self.update_status("📊 Generating statistical summary...", "info")
+        self.run_analysis(build_summary_report, "✅ Statistical summary generated",
+                          "Failed to generate summary")
     
     def correlation_analysis(self):
         """Perform correlation analysis"""
@@ -800,54 +1457,82 @@ Ready to analyze some data? 📈
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
+        if not self.numeric_cols:
+            messagebox.showwarning("Warning", "No numeric columns for correlation analysis!")
+            return
+        
+        self.update_status("🔗 Computing correlations...", "info")
+        self.run_analysis(build_correlation_report, "✅ Correlation analysis completed",
+                          "Correlation analysis failed", self.settings['corr_dtype'])
+    
+    def run_analysis(self, build, status_message, error_message, *args):
+        """Run a report builder on the worker pool against the current data and show its text once it finishes"""
+        snapshot = self.snapshot
+        future = self.executor.submit(build, snapshot, *args)
+        
+        def deliver(done):
+            try:
+                self.root.after(0, self.finish_analysis, done, snapshot, status_message, error_message)
+            except (RuntimeError, tk.TclError):
+                # The window was closed while the analysis was running
+                pass
+        
+        future.add_done_callback(deliver)
+    
+    def finish_analysis(self, future, snapshot, status_message, error_message):
+        """Display a finished report (runs on the Tk thread)"""
+        if self.snapshot is not snapshot:
+            # A different dataset was loaded while this one was being analyzed
+            return
+        
         try:
-            numeric_df = self.df.select_dtypes(include=[np.number])
-            
-            if numeric_df.empty:
-                messagebox.showwarning("Warning", "No numeric columns for correlation analysis!")
-                return
-            
-            corr_matrix = numeric_df.corr()
-            
-            # Display results
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.delete(1.0, tk.END)
-            
-            result_text = f"""🔗 CORRELATION ANALYSIS
-{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-{'='*50}
-
-Correlation Matrix:
-{corr_matrix.round(3).to_string()}
-
-🔥 Strong Correlations (|r| > 0.7):
-{'='*40}
-"""
-            
-            # Find strong correlations
-            strong_corr = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.7:
-                        strong_corr.append((corr_matrix.columns[i], corr_matrix.columns[j], corr_val))
-            
-            if strong_corr:
-                for col1, col2, corr_val in strong_corr:
-                    result_text += f"{col1} ↔ {col2}: {corr_val:.3f}\n"
-            else:
-                result_text += "No strong correlations found (|r| > 0.7)\n"
-            
-            self.results_text.insert(tk.END, result_text)
-            self.results_text.config(state=tk.DISABLED)
-            
-            # Switch to results tab
-            self.right_notebook.select(self.results_frame)
-            
-            self.update_status("✅ Correlation analysis completed", "success")
-            
+            report = future.result()
         except Exception as e:
-            messagebox.showerror("Error", f"Correlation analysis failed:\n{str(e)}")
+            messagebox.showerror("Error", f"{error_message}:\n{str(e)}")
+            self.update_status(f"❌ {error_message}", "error")
+            return
+        
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, report)
+        self.results_text.config(state=tk.DISABLED)
+        
+        # Switch to results tab
+        self.right_notebook.select(self.results_frame)
+        
+        self.update_status(status_message, "success")
+    
+    def export_correlation_matrix(self):
+        """Save the full correlation matrix as CSV"""
+        if self.df is None:
+            messagebox.showwarning("Warning", "No data loaded!")
+            return
+        
+        if not self.numeric_cols:
+            messagebox.showwarning("Warning", "No numeric columns for correlation analysis!")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            title="Export correlation matrix",
+            defaultextension=".csv",
+            filetypes=[
+                ("CSV files", "*.csv"),
+                ("All files", "*.*")
+            ]
+        )
+        
+        if file_path:
+            try:
+                self.get_correlation_matrix().to_csv(file_path)
+                messagebox.showinfo("Success", f"Correlation matrix exported successfully!\n{file_path}")
+                self.update_status("✅ Correlation matrix exported", "success")
+                
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to export correlation matrix:\n{str(e)}")
+    
+    def get_correlation_matrix(self):
+        """Correlation matrix of the numeric columns, computed once per dataset"""
+        return self.snapshot.correlation_matrix(self.settings['corr_dtype'])
     
     def plot_correlation_heatmap(self):
         """Create correlation heatmap"""
@@ -856,29 +1541,42 @@ Correlation Matrix:
             return
         
         try:
-            numeric_df = self.df.select_dtypes(include=[np.number])
+            numeric_df, _, _ = self.get_numeric_data()
             
             if numeric_df.empty:
                 messagebox.showwarning("Warning", "No numeric columns for correlation heatmap!")
                 return
             
-            self.fig.clear()
-            ax = self.fig.add_subplot(111)
+            ax, _ = self.prepare_axes('heatmap')
             
-            corr_matrix = numeric_df.corr()
+            corr_matrix = self.get_correlation_matrix()
             
-            # Create heatmap
-            sns.heatmap(corr_matrix, annot=True, cmap='RdBu_r', center=0,
-                       square=True, fmt='.2f', cbar_kws={"shrink": .8}, ax=ax)
+            # Create heatmap as a single image rather than one patch per cell
+            C = corr_matrix.to_numpy()
+            columns = list(corr_matrix.columns)
+            n_cols = len(columns)
             
-            ax.set_title('🔥 Correlation Matrix Heatmap', fontsize=14, fontweight='bold', pad=20)
+            im = ax.imshow(C, cmap='RdBu_r', vmin=-1, vmax=1, interpolation='nearest')
+            self.fig.colorbar(im, ax=ax, shrink=.8)
+            ax.grid(False)
+            
+            # Annotate cells only while they are large enough to read
+            if n_cols <= 15:
+                for i in range(n_cols):
+                    for j in range(n_cols):
+                        if not np.isnan(C[i, j]):
+                            ax.text(j, i, f'{C[i, j]:.2f}', ha='center', va='center', fontsize=9,
+                                   color='white' if abs(C[i, j]) > 0.5 else 'black')
+            
+            ax.set_title(f'🔥 Correlation Matrix Heatmap{self.snapshot.preview_label()}', fontsize=14, fontweight='bold', pad=20)
             
             # Rotate labels for better readability
-            ax.set_xticklabels(ax.get_xticklabels(), rotation=45, ha='right')
-            ax.set_yticklabels(ax.get_yticklabels(), rotation=0)
+            ax.set_xticks(range(n_cols))
+            ax.set_xticklabels(columns, rotation=45, ha='right')
+            ax.set_yticks(range(n_cols))
+            ax.set_yticklabels(columns, rotation=0)
             
-            self.fig.tight_layout()
-            self.canvas.draw()
+            self.schedule_draw()
             
             # Switch to plot tab
             self.right_notebook.select(self.plot_frame)
@@ -901,18 +1599,22 @@ Correlation Matrix:
                 messagebox.showwarning("Warning", "Selected column not found!")
                 return
             
-            self.fig.clear()
-            ax = self.fig.add_subplot(111)
+            ax, _ = self.prepare_axes('histogram')
             
-            if self.df[column].dtype in ['object', 'category']:
+            if column in self.categorical_cols:
                 # Bar plot for categorical data
-                value_counts = self.df[column].value_counts().head(15)
+                if self.df[column].dtype == 'category':
+                    value_counts = self.df[column].value_counts().head(15)
+                else:
+                    # Top 15 through a heap instead of sorting every distinct value
+                    top = Counter(self.df[column].dropna().to_numpy()).most_common(15)
+                    value_counts = pd.Series([count for _, count in top], index=[value for value, _ in top])
                 bars = ax.bar(range(len(value_counts)), value_counts.values, 
                             color=sns.color_palette(self.settings['color_palette'], len(value_counts)))
                 ax.set_xticks(range(len(value_counts)))
                 ax.set_xticklabels(value_counts.index, rotation=45, ha='right')
                 ax.set_ylabel('Count')
-                ax.set_title(f'📊 Distribution of {column}', fontsize=14, fontweight='bold')
+                ax.set_title(f'📊 Distribution of {column}{self.snapshot.preview_label()}', fontsize=14, fontweight='bold')
                 
                 # Add value labels on bars
                 for bar, value in zip(bars, value_counts.values):
@@ -922,10 +1624,13 @@ Correlation Matrix:
             else:
                 # Histogram for numeric data
                 data = self.df[column].dropna()
-                ax.hist(data, bins=30, alpha=0.7, color=self.colors['accent'], edgecolor='black')
+                arr = data.to_numpy(dtype=np.float64)
+                # Bin edges only depend on the column, so re-plots skip the min/max pass
+                edges = self.cached(('hist_edges', column), lambda: np.histogram_bin_edges(arr, bins=30))
+                ax.hist(arr, bins=edges, alpha=0.7, color=self.colors['accent'], edgecolor='black')
                 ax.set_xlabel(column)
                 ax.set_ylabel('Frequency')
-                ax.set_title(f'📊 Histogram of {column}', fontsize=14, fontweight='bold')
+                ax.set_title(f'📊 Histogram of {column}{self.snapshot.preview_label()}', fontsize=14, fontweight='bold')
                 
                 # Add statistics text
                 stats_text = f'Mean: {data.mean():.2f}\nStd: {data.std():.2f}\nCount: {len(data)}'
@@ -933,8 +1638,7 @@ Correlation Matrix:
                        bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['bg_light'], alpha=0.8),
                        verticalalignment='top', fontsize=10)
             
-            self.fig.tight_layout()
-            self.canvas.draw()
+            self.schedule_draw()
             
             # Switch to plot tab
             self.right_notebook.select(self.plot_frame)
@@ -956,7 +1660,7 @@ Correlation Matrix:
         dialog.geometry("300x200")
         dialog.configure(bg=self.colors['bg_medium'])
         
-        numeric_cols = list(self.df.select_dtypes(include=[np.number]).columns)
+        numeric_cols = list(self.numeric_cols)
         
         if len(numeric_cols) < 2:
             messagebox.showwarning("Warning", "Need at least 2 numeric columns for scatter plot!")
@@ -978,24 +1682,53 @@ Correlation Matrix:
         def create_scatter():
             try:
                 x_col, y_col = x_var.get(), y_var.get()
+                source = (self.data_version, x_col, y_col)
+                large = len(self.df) > self.settings['max_plot_points']
+                same_columns = (not large and self.scatter_source is not None
+                                and self.scatter_source[1:] == source[1:])
                 
-                self.fig.clear()
-                ax = self.fig.add_subplot(111)
-                
-                ax.scatter(self.df[x_col], self.df[y_col], alpha=0.6, 
-                          color=self.colors['accent'], s=50)
-                ax.set_xlabel(x_col)
-                ax.set_ylabel(y_col)
-                ax.set_title(f'🌟 Scatter Plot: {x_col} vs {y_col}', fontsize=14, fontweight='bold')
-                
-                # Add correlation coefficient
-                corr = self.df[x_col].corr(self.df[y_col])
-                ax.text(0.05, 0.95, f'Correlation: {corr:.3f}', transform=ax.transAxes,
-                       bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['bg_light'], alpha=0.8),
-                       verticalalignment='top', fontsize=10)
+                ax, reused = self.prepare_axes('scatter', reuse=same_columns)
                 
-                self.fig.tight_layout()
-                self.canvas.draw()
+                if reused and self.scatter_source == source:
+                    # Nothing changed since the last render: keep what is on screen
+                    pass
+                else:
+                    x = self.df[x_col].to_numpy(dtype=np.float64, na_value=np.nan)
+                    y = self.df[y_col].to_numpy(dtype=np.float64, na_value=np.nan)
+                    corr = self.df[x_col].corr(self.df[y_col])
+                    
+                    if reused:
+                        # Same columns, new data: move the existing points instead of rebuilding the Axes
+                        offsets = np.column_stack([x, y])
+                        self.scatter_artist.set_offsets(offsets)
+                        self.scatter_text.set_text(f'Correlation: {corr:.3f}')
+                        ax.ignore_existing_data_limits = True
+                        ax.update_datalim(offsets)
+                        ax.autoscale_view()
+                        ax.set_title(f'🌟 Scatter Plot: {x_col} vs {y_col}{self.snapshot.preview_label()}',
+                                     fontsize=14, fontweight='bold')
+                    else:
+                        if large:
+                            # Aggregate into hexagonal bins instead of drawing every point
+                            mask = ~(np.isnan(x) | np.isnan(y))
+                            hb = ax.hexbin(x[mask], y[mask], gridsize=200, cmap='viridis', mincnt=1)
+                            self.fig.colorbar(hb, ax=ax, label='Count')
+                            self.scatter_artist = None
+                        else:
+                            self.scatter_artist = ax.scatter(x, y, alpha=0.6,
+                                                             color=self.colors['accent'], s=50)
+                        ax.set_xlabel(x_col)
+                        ax.set_ylabel(y_col)
+                        ax.set_title(f'🌟 Scatter Plot: {x_col} vs {y_col}{self.snapshot.preview_label()}',
+                                     fontsize=14, fontweight='bold')
+                        
+                        # Add correlation coefficient
+                        self.scatter_text = ax.text(0.05, 0.95, f'Correlation: {corr:.3f}', transform=ax.transAxes,
+                                                    bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['bg_light'], alpha=0.8),
+                                                    verticalalignment='top', fontsize=10)
+                    
+                    self.scatter_source = source if self.scatter_artist is not None else None
+                    self.schedule_draw()
                 
                 # Switch to plot tab
                 self.right_notebook.select(self.plot_frame)
@@ -1028,7 +1761,10 @@ Correlation Matrix:
         
         if file_path:
             try:
-                self.fig.savefig(file_path, dpi=300, bbox_inches='tight',
+                # Vector formats don't rasterize the figure, so only bitmaps need a resolution
+                ext = os.path.splitext(file_path)[1].lower()
+                dpi = None if ext in ('.pdf', '.svg', '.eps', '.ps') else self.settings['save_dpi']
+                self.fig.savefig(file_path, dpi=dpi, bbox_inches='tight',
                                facecolor=self.colors['bg_dark'])
                 messagebox.showinfo("Success", f"Plot saved successfully!\n{file_path}")
                 self.update_status("✅ Plot saved successfully", "success")
@@ -1045,6 +1781,58 @@ Correlation Matrix:
     # Additional methods for other plot types and analysis would go here...
     # Due to length constraints, I'm including the essential structure
     
+    def plot_line(self):
+        """Create line plot of the selected column against row position"""
+        if self.df is None or not self.column_var.get():
+            messagebox.showwarning("Warning", "No data or column selected!")
+            return
+        
+        column = self.column_var.get()
+        if not pd.api.types.is_numeric_dtype(self.df[column]):
+            messagebox.showwarning("Warning", "Line plot needs a numeric column!")
+            return
+        
+        try:
+            values = self.df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            x = np.flatnonzero(~np.isnan(values))
+            y = values[x]
+            n_points = len(y)
+            
+            # Decimate long series while keeping their visual shape
+            if n_points > self.settings['max_plot_points']:
+                keep = lttb_indices(x.astype(np.float64), y, self.settings['line_plot_points'])
+                x, y = x[keep], y[keep]
+            
+            ax, reused = self.prepare_axes('line', reuse=True)
+            
+            if reused:
+                # Same plot type: move the existing line instead of rebuilding the Axes
+                self.line_artist.set_data(x, y)
+                for text in list(ax.texts):
+                    text.remove()
+                ax.relim()
+                ax.autoscale_view()
+            else:
+                self.line_artist, = ax.plot(x, y, color=self.colors['accent'], linewidth=1)
+            ax.set_xlabel('Row')
+            ax.set_ylabel(column)
+            ax.set_title(f'📈 Line Plot of {column}{self.snapshot.preview_label()}', fontsize=14, fontweight='bold')
+            
+            if len(y) < n_points:
+                ax.text(0.02, 0.95, f'Showing {len(y):,} of {n_points:,} points (LTTB)', transform=ax.transAxes,
+                       bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['bg_light'], alpha=0.8),
+                       verticalalignment='top', fontsize=10)
+            
+            self.schedule_draw()
+            
+            # Switch to plot tab
+            self.right_notebook.select(self.plot_frame)
+            
+            self.update_status(f"✅ Line plot created for {column}", "success")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to create line plot:\n{str(e)}")
+    
     def analyze_column(self):
         """Analyze selected column"""
         if self.df is None or not self.column_var.get():
@@ -1052,60 +1840,231 @@ Correlation Matrix:
             return
         
         column = self.column_var.get()
-        data = self.df[column]
         
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
+        # A column of a lazily scanned file is read from disk, so keep it off the Tk thread
+        self.update_status(f"🔍 Analyzing {column}...", "info")
+        self.run_analysis(build_column_report, f"✅ Analysis completed for {column}",
+                          f"Failed to analyze {column}", column)
+    
+    def outlier_detection(self):
+        """Detect outliers in numeric columns with the IQR and z-score rules"""
+        if self.df is None:
+            messagebox.showwarning("Warning", "No data loaded!")
+            return
         
-        result_text = f"""🔍 COLUMN ANALYSIS: {column}
+        try:
+            numeric_df, X, offsets = self.get_numeric_data()
+            
+            if numeric_df.empty:
+                messagebox.showwarning("Warning", "No numeric columns for outlier detection!")
+                return
+            
+            with PARALLEL_LOCK:
+                lo, hi, n_out = iqr_bounds(X, 1.5)
+                z_counts = zscore_flags(X, 3.0).sum(axis=0)
+            # Fences come back relative to the column means
+            lo, hi = lo + offsets, hi + offsets
+            n_rows = len(numeric_df)
+            
+            self.results_text.config(state=tk.NORMAL)
+            self.results_text.delete(1.0, tk.END)
+            
+            parts = [f"""🔍 OUTLIER DETECTION
 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 {'='*50}
+{self.snapshot.preview_note()}
+📦 IQR Method (outside Q1 - 1.5×IQR .. Q3 + 1.5×IQR):
+{'='*40}
+"""]
+            for col, low, high, count in zip(numeric_df.columns, lo, hi, n_out):
+                parts.append(f"{col:20} : {count:5d} ({count / n_rows * 100:.1f}%)  bounds [{low:.3f}, {high:.3f}]\n")
+            
+            parts.append(f"\n📈 Z-Score Method (|z| > 3):\n{'='*40}\n")
+            for col, count in zip(numeric_df.columns, z_counts):
+                parts.append(f"{col:20} : {count:5d} ({count / n_rows * 100:.1f}%)\n")
+            
+            self.results_text.insert(tk.END, "".join(parts))
+            self.results_text.config(state=tk.DISABLED)
+            
+            # Switch to results tab
+            self.right_notebook.select(self.results_frame)
+            
+            self.update_status("✅ Outlier detection completed", "success")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Outlier detection failed:\n{str(e)}")
+    
+    def standardize_rows(self, X, rows):
+        """Z-score the selected rows of X, working in place on the float32 copy"""
+        # Boolean indexing copies, so the buffer can be modified in place
+        points = X[rows]
+        points -= points.mean(axis=0)
+        std = points.std(axis=0)
+        std[std == 0] = 1
+        points /= std
+        return points
+    
+    def pca_analysis(self):
+        """Project the standardized numeric columns onto their first two principal components"""
+        if self.df is None:
+            messagebox.showwarning("Warning", "No data loaded!")
+            return
+        
+        try:
+            numeric_df, X, _ = self.get_numeric_data()
+            
+            if numeric_df.shape[1] < 2:
+                messagebox.showwarning("Warning", "Need at least 2 numeric columns for PCA!")
+                return
+            
+            complete = np.isfinite(X).all(axis=1)
+            if complete.sum() < 2:
+                messagebox.showwarning("Warning", "Not enough complete rows for PCA!")
+                return
+            points = self.standardize_rows(X, complete)
+            
+            # Randomized SVD only computes the two leading components
+            pca = PCA(n_components=2, svd_solver='randomized', random_state=0)
+            scores = pca.fit_transform(points)
+            ratios = pca.explained_variance_ratio_
+            loadings = pd.DataFrame(pca.components_.T, index=numeric_df.columns, columns=['PC1', 'PC2'])
+            
+            # Display results
+            self.results_text.config(state=tk.NORMAL)
+            self.results_text.delete(1.0, tk.END)
+            
+            result_text = f"""🎯 PCA ANALYSIS
+{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+{'='*50}
+{self.snapshot.preview_note()}
+Rows used: {len(points):,} (rows with missing values skipped)
+Columns: {numeric_df.shape[1]} (standardized)
 
-Data Type: {data.dtype}
-Non-null Count: {data.count():,} / {len(data):,}
-Missing Values: {data.isnull().sum():,} ({data.isnull().sum()/len(data)*100:.1f}%)
+📊 Explained Variance:
+{'='*40}
+PC1: {ratios[0] * 100:.1f}%
+PC2: {ratios[1] * 100:.1f}%
+Total: {ratios.sum() * 100:.1f}%
 
+🔗 Loadings:
+{'='*40}
+{loadings.round(3).to_string()}
 """
+            
+            self.results_text.insert(tk.END, result_text)
+            self.results_text.config(state=tk.DISABLED)
+            
+            ax, _ = self.prepare_axes('pca')
+            
+            ax.scatter(scores[:, 0], scores[:, 1], alpha=0.6, color=self.colors['accent'], s=20,
+                      rasterized=len(scores) > self.settings['max_plot_points'])
+            ax.set_xlabel(f'PC1 ({ratios[0] * 100:.1f}%)')
+            ax.set_ylabel(f'PC2 ({ratios[1] * 100:.1f}%)')
+            ax.set_title(f'🎯 PCA Projection{self.snapshot.preview_label()}', fontsize=14, fontweight='bold')
+            
+            self.schedule_draw()
+            
+            # Switch to plot tab
+            self.right_notebook.select(self.plot_frame)
+            
+            self.update_status("✅ PCA analysis completed", "success")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"PCA analysis failed:\n{str(e)}")
+    
+    def clustering_analysis(self):
+        """Cluster the rows on their standardized numeric columns with k-means"""
+        if self.df is None:
+            messagebox.showwarning("Warning", "No data loaded!")
+            return
         
-        if data.dtype in ['int64', 'float64']:
-            result_text += f"""📊 NUMERIC ANALYSIS:
-Mean: {data.mean():.3f}
-Median: {data.median():.3f}
-Mode: {data.mode().iloc[0] if len(data.mode()) > 0 else 'N/A'}
-Standard Deviation: {data.std():.3f}
-Min: {data.min():.3f}
-Max: {data.max():.3f}
-Range: {data.max() - data.min():.3f}
-Skewness: {data.skew():.3f}
-Kurtosis: {data.kurtosis():.3f}
+        try:
+            numeric_df, X, offsets = self.get_numeric_data()
+            k = self.settings['n_clusters']
+            
+            if numeric_df.shape[1] < 2:
+                messagebox.showwarning("Warning", "Need at least 2 numeric columns for clustering!")
+                return
+            
+            complete = np.isfinite(X).all(axis=1)
+            if complete.sum() < k:
+                messagebox.showwarning("Warning", "Not enough complete rows for clustering!")
+                return
+            points = self.standardize_rows(X, complete)
+            xy = X[complete, :2] + offsets[:2]
+            
+            labels, centers, method = self.fit_kmeans(points, k)
+            
+            # Display results
+            self.results_text.config(state=tk.NORMAL)
+            self.results_text.delete(1.0, tk.END)
+            
+            sizes = np.bincount(labels, minlength=k)
+            centers_df = pd.DataFrame(centers, columns=numeric_df.columns,
+                                      index=[f"Cluster {i}" for i in range(k)])
+            
+            parts = [f"""🎪 CLUSTERING ANALYSIS
+{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+{'='*50}
+{self.snapshot.preview_note()}
+Method: {method}
+Clusters: {k}
+Rows used: {len(points):,} (rows with missing values skipped)
 
-Quartiles:
-Q1 (25%): {data.quantile(0.25):.3f}
-Q2 (50%): {data.quantile(0.50):.3f}
-Q3 (75%): {data.quantile(0.75):.3f}
-IQR: {data.quantile(0.75) - data.quantile(0.25):.3f}
-"""
+📊 Cluster Sizes:
+{'='*40}
+"""]
+            for i, size in enumerate(sizes):
+                parts.append(f"Cluster {i}: {size:,} ({size / len(points) * 100:.1f}%)\n")
+            
+            parts.append(f"\n🎯 Cluster Centers (standardized):\n{'='*40}\n{centers_df.round(3).to_string()}\n")
+            
+            self.results_text.insert(tk.END, "".join(parts))
+            self.results_text.config(state=tk.DISABLED)
+            
+            # Plot clusters on the first two numeric columns
+            ax, _ = self.prepare_axes('clusters')
+            
+            scatter = ax.scatter(xy[:, 0], xy[:, 1], c=labels, cmap='tab10', s=20, alpha=0.7,
+                                 rasterized=len(xy) > self.settings['max_plot_points'])
+            ax.legend(*scatter.legend_elements(), title='Cluster')
+            ax.set_xlabel(numeric_df.columns[0])
+            ax.set_ylabel(numeric_df.columns[1])
+            ax.set_title(f'🎪 K-Means Clustering (k={k}){self.snapshot.preview_label()}', fontsize=14, fontweight='bold')
+            
+            self.schedule_draw()
+            
+            # Switch to plot tab
+            self.right_notebook.select(self.plot_frame)
+            
+            self.update_status(f"✅ Clustering completed ({method})", "success")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Clustering analysis failed:\n{str(e)}")
+    
+    def fit_kmeans(self, points, k):
+        """Run the fastest available k-means for the data size; returns (labels, centers, method)"""
+        large = len(points) > self.settings['minibatch_threshold']
+        
+        if large and FAISS_AVAILABLE:
+            kmeans = faiss.Kmeans(points.shape[1], k, niter=20, seed=0)
+            kmeans.train(points)
+            _, assignment = kmeans.index.search(points, 1)
+            return assignment.ravel(), kmeans.centroids, "FAISS k-means"
+        
+        if large:
+            kmeans = MiniBatchKMeans(n_clusters=k, batch_size=min(4096, len(points) // 10),
+                                     n_init=1, random_state=0)
+            method = "Mini-batch k-means"
         else:
-            value_counts = data.value_counts().head(10)
-            result_text += f"""📝 CATEGORICAL ANALYSIS:
-Unique Values: {data.nunique():,}
-Most Common: {data.mode().iloc[0] if len(data.mode()) > 0 else 'N/A'}
-
-Top 10 Values:
-{value_counts.to_string()}
-"""
+            kmeans = KMeans(n_clusters=k, n_init=3, algorithm='elkan', random_state=0)
+            method = "K-means (Elkan)"
         
-        self.results_text.insert(tk.END, result_text)
-        self.results_text.config(state=tk.DISABLED)
-        
-        # Switch to results tab
-        self.right_notebook.select(self.results_frame)
-        
-        self.update_status(f"✅ Analysis completed for {column}", "success")
+        labels = kmeans.fit_predict(points)
+        return labels, kmeans.cluster_centers_, method
     
     # Placeholder methods for additional features
     def plot_column(self): self.plot_histogram()
-    def plot_line(self): messagebox.showinfo("Info", "Line plot feature coming soon!")
     def plot_boxplot(self): messagebox.showinfo("Info", "Box plot feature coming soon!")
     def plot_pie(self): messagebox.showinfo("Info", "Pie chart feature coming soon!")
     def plot_bar(self): messagebox.showinfo("Info", "Bar plot feature coming soon!")
@@ -1116,11 +2075,8 @@ Top 10 Values:
     def show_data_types(self): messagebox.showinfo("Info", "Data types feature implemented in data info!")
     def analyze_missing_values(self): messagebox.showinfo("Info", "Missing values analysis in data info!")
     def distribution_analysis(self): self.plot_histogram()
-    def outlier_detection(self): messagebox.showinfo("Info", "Outlier detection feature coming soon!")
     def feature_importance(self): messagebox.showinfo("Info", "Feature importance coming soon!")
     def normality_test(self): messagebox.showinfo("Info", "Normality test coming soon!")
-    def pca_analysis(self): messagebox.showinfo("Info", "PCA analysis coming soon!")
-    def clustering_analysis(self): messagebox.showinfo("Info", "Clustering analysis coming soon!")
     def anova_analysis(self): messagebox.showinfo("Info", "ANOVA test coming soon!")
     def data_cleaner(self): messagebox.showinfo("Info", "Data cleaner tool coming soon!")
     def feature_engineer(self): messagebox.showinfo("Info", "Feature engineering coming soon!")
@@ -1140,6 +2096,9 @@ def main():
     root.geometry(f"+{x}+{y}")
     
     root.mainloop()
+    
+    # Drop queued analyses; one already running still finishes before the interpreter exits
+    app.executor.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == "__main__":
     main()